@@ -1,23 +1,27 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse
 from app.services.tts import TTSService
-from app.services.aligner import AlignerService
 from app.services.scorer import ScorerService
 from app.services.recognizer import RecognizerService
 from app.services.phoneme_converter import convert_phonemes
-import shutil
+import aiofiles
+import asyncio
 import os
 import uuid
 import json
-import traceback
-import sys
+import logging
+from functools import lru_cache
 from app.core.config import settings
 from g2p_en import G2p
 
+log = logging.getLogger(__name__)
+
 router = APIRouter()
-aligner_service = AlignerService()
-scorer_service = ScorerService()
-recognizer_service = RecognizerService()
+
+# Heavy models are created on first use (or warmed up at startup, see main.py)
+_g2p_model = None
+_recognizer_service = None
+_scorer_service = None
 
 AVAILABLE_VOICES = [
     {"id": "en-US-AriaNeural", "label": "Aria (US Female)"},
@@ -29,14 +33,74 @@ AVAILABLE_VOICES = [
     {"id": "en-AU-WilliamNeural", "label": "William (AU Male)"},
 ]
 
-print("Loading G2P model...")
-try:
-    g2p_model = G2p()
-    print("G2P model loaded.")
-except Exception as e:
-    print(f"Failed to initialize G2P model: {e}")
-    traceback.print_exc()
-    g2p_model = None
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Non-phoneme tokens emitted by g2p_en
+_PUNCT_ARPA = frozenset({"'", ",", ".", " ", "?", "!"})
+
+
+def get_g2p() -> G2p:
+    global _g2p_model
+    if _g2p_model is None:
+        log.info("Loading G2P model...")
+        _g2p_model = G2p()
+        log.info("G2P model loaded.")
+    return _g2p_model
+
+
+def get_recognizer() -> RecognizerService:
+    global _recognizer_service
+    if _recognizer_service is None:
+        _recognizer_service = RecognizerService()
+    return _recognizer_service
+
+
+def get_scorer() -> ScorerService:
+    global _scorer_service
+    if _scorer_service is None:
+        _scorer_service = ScorerService()
+    return _scorer_service
+
+
+@lru_cache(maxsize=32)
+def _get_tts(voice: str, rate: str) -> TTSService:
+    return TTSService(voice=voice, rate=rate)
+
+
+@lru_cache(maxsize=4096)
+def _text_to_phonemes(text: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Runs G2P on the text and returns (ARPAbet, IPA) phonemes with punctuation removed.
+    Memoized so repeated practice of the same sentence skips G2P inference.
+    """
+    phonemes_arpa = get_g2p()(text)
+    phonemes_arpa = [p for p in phonemes_arpa if p and not p.isspace() and p not in _PUNCT_ARPA]
+    phonemes_ipa = convert_phonemes(phonemes_arpa)
+    return tuple(phonemes_arpa), tuple(phonemes_ipa)
+
+
+def _parse_ref_phonemes(ref_phonemes: str) -> list[str] | None:
+    """
+    Parses the JSON list of IPA phonemes posted by the client.
+    Returns None if the field is empty or malformed.
+    """
+    try:
+        phonemes = json.loads(ref_phonemes)
+    except ValueError:
+        return None
+    if isinstance(phonemes, list) and phonemes and all(isinstance(p, str) for p in phonemes):
+        return phonemes
+    return None
+
+
+def _remove_file(path: str) -> bool:
+    """Deletes a file with a single unlink. Returns False if it did not exist."""
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+
 
 @router.get("/voices")
 def get_voices():
@@ -52,29 +116,18 @@ async def init_practice(
     """
     Generates reference audio and phonemes for the given text.
     """
-    print(f"[API] Received init request for text: {text}, voice: {voice}, rate: {rate}")
+    log.debug("Received init request for text: %s, voice: %s, rate: %s", text, voice, rate)
     try:
-        # 1. Generate TTS audio
-        print("[API] Calling TTS Service...")
-        tts_service = TTSService(voice=voice, rate=rate)
-        audio_path = await tts_service.generate_audio(text)
-        print(f"[API] TTS Audio generated at: {audio_path}")
-        
-        # 2. Generate Reference Phonemes
-        print("[API] Generating phonemes...")
-        global g2p_model
-        if not g2p_model:
-             print("[API] Initializing G2P model just in time...")
-             g2p_model = G2p()
-             
-        phonemes_arpa = g2p_model(text)
-        # Clean phonemes
-        phonemes_arpa = [p for p in phonemes_arpa if p.strip() and p not in ["'", ",", ".", " ", "?", "!"]]
-        print(f"[API] ARPAbet phonemes: {phonemes_arpa}")
-        
-        # Convert to IPA for display
-        phonemes_ipa = convert_phonemes(phonemes_arpa)
-        print(f"[API] IPA phonemes: {phonemes_ipa}")
+        # 1. Generate TTS audio and reference phonemes (ARPAbet + IPA for display) concurrently
+        log.debug("Calling TTS Service and generating phonemes...")
+        tts_service = _get_tts(voice, rate)
+        audio_path, (phonemes_arpa, phonemes_ipa) = await asyncio.gather(
+            tts_service.generate_audio(text),
+            asyncio.to_thread(_text_to_phonemes, text),
+        )
+        log.debug("TTS Audio generated at: %s", audio_path)
+        log.debug("ARPAbet phonemes: %s", phonemes_arpa)
+        log.debug("IPA phonemes: %s", phonemes_ipa)
         
         # Return relative path for frontend to access (we need to serve static files)
         filename = os.path.basename(audio_path)
@@ -82,67 +135,74 @@ async def init_practice(
         
         response_data = {
             "audio_url": audio_url,
-            "phonemes": phonemes_ipa,
-            "phonemes_arpa": phonemes_arpa,
+            "phonemes": list(phonemes_ipa),
+            "phonemes_arpa": list(phonemes_arpa),
             "text": text
         }
-        print(f"[API] Returning response: {response_data}")
+        log.debug("Returning response: %s", response_data)
         return JSONResponse(response_data)
         
     except Exception as e:
-        print(f"[API] Error in init_practice: {e}")
-        traceback.print_exc()
-        # Explicitly print to stderr for backup
-        print(traceback.format_exc(), file=sys.stderr)
+        log.exception("Error in init_practice: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/practice/score")
-def score_practice(audio: UploadFile = File(...), text: str = Form(...), ref_phonemes: str = Form(...)):
+async def score_practice(audio: UploadFile = File(...), text: str = Form(...), ref_phonemes: str = Form("")):
     """
     Scores the user's pronunciation against the reference.
     Uses Whisper to transcribe the user's actual audio, then compares phonemes.
+
+    `ref_phonemes` is the JSON-encoded list of IPA phonemes returned as `phonemes`
+    by /practice/init, e.g. '["h", "ʌ", "l", "oʊ"]'. When it is missing or malformed
+    the reference phonemes are re-generated from `text`.
     """
-    print(f"[API] Received score request for text: {text}")
+    log.debug("Received score request for text: %s", text)
+    filename = f"user_{uuid.uuid4().hex}.wav"
+    user_audio_path = os.path.join(settings.INPUT_DIR_STR, filename)
     try:
         # 1. Save user audio
-        filename = f"user_{uuid.uuid4()}.wav"
-        user_audio_path = settings.INPUT_DIR / filename
-        os.makedirs(settings.INPUT_DIR, exist_ok=True)
-        
-        print(f"[API] Saving user audio to {user_audio_path}")
-        with open(user_audio_path, "wb") as buffer:
-            shutil.copyfileobj(audio.file, buffer)
+        log.debug("Saving user audio to %s", user_audio_path)
+        async with aiofiles.open(user_audio_path, "wb") as buffer:
+            while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
             
-        # 2. Transcribe user audio with Whisper (actual speech recognition)
-        print("[API] Transcribing user audio with Whisper...")
-        transcribed_text = recognizer_service.transcribe(str(user_audio_path))
-        print(f"[API] User said: '{transcribed_text}'")
+        # 2. Transcribe user audio with Whisper (actual speech recognition). Use the
+        #    reference phonemes sent by the client, or re-generate them from text meanwhile.
+        log.debug("Transcribing user audio with Whisper...")
+        transcription = asyncio.to_thread(get_recognizer().transcribe, user_audio_path)
+        ref_phonemes_ipa = _parse_ref_phonemes(ref_phonemes)
+        if ref_phonemes_ipa is None:
+            # Wait for both even if one fails: the Whisper thread can't be cancelled and
+            # must be done with the recording before the finally block removes it
+            results = await asyncio.gather(
+                transcription,
+                asyncio.to_thread(_text_to_phonemes, text),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            transcribed_text, (_, ref_phonemes_ipa) = results
+        else:
+            transcribed_text = await transcription
+        log.debug("User said: '%s'", transcribed_text)
+        log.debug("Reference phonemes (IPA): %s", ref_phonemes_ipa)
         
         # 3. Generate phonemes from what the user actually said
-        global g2p_model
-        if not g2p_model:
-            g2p_model = G2p()
-        
-        user_phonemes_arpa = g2p_model(transcribed_text)
-        user_phonemes_arpa = [p for p in user_phonemes_arpa if p.strip() and p not in ["'", ",", ".", " ", "?", "!"]]
-        user_phonemes_ipa = convert_phonemes(user_phonemes_arpa)
-        print(f"[API] User phonemes (IPA): {user_phonemes_ipa}")
-        
-        # 4. Get reference phonemes (re-generate from text to ensure consistency)
-        ref_phonemes_arpa = g2p_model(text)
-        ref_phonemes_arpa = [p for p in ref_phonemes_arpa if p.strip() and p not in ["'", ",", ".", " ", "?", "!"]]
-        ref_phonemes_ipa = convert_phonemes(ref_phonemes_arpa)
-        print(f"[API] Reference phonemes (IPA): {ref_phonemes_ipa}")
+        _, user_phonemes_ipa = await asyncio.to_thread(_text_to_phonemes, transcribed_text)
+        log.debug("User phonemes (IPA): %s", user_phonemes_ipa)
             
-        # 5. Compare IPA phonemes
-        print("[API] Scoring comparison...")
-        score_result = scorer_service.compare_phonemes(ref_phonemes_ipa, user_phonemes_ipa)
+        # 4. Compare IPA phonemes
+        log.debug("Scoring comparison...")
+        score_result = get_scorer().compare_phonemes(list(ref_phonemes_ipa), list(user_phonemes_ipa))
         score_result["transcribed_text"] = transcribed_text
-        print(f"[API] Score: {score_result['score']}")
+        log.debug("Score: %s", score_result["score"])
         
         return JSONResponse(score_result)
         
     except Exception as e:
-        print(f"[API] Error in score_practice: {e}")
-        traceback.print_exc()
+        log.exception("Error in score_practice: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # The recording is only needed for transcription
+        await asyncio.to_thread(_remove_file, user_audio_path)
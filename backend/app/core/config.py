@@ -8,5 +8,8 @@ class Settings:
     DATA_DIR: Path = Path("/tmp/data") if os.environ.get("ENV") == "prod" else BASE_DIR / "data"
     INPUT_DIR: Path = DATA_DIR / "inputs"
     OUTPUT_DIR: Path = DATA_DIR / "outputs"
+    # String forms for per-request os.path.join, avoiding Path allocations
+    INPUT_DIR_STR: str = str(INPUT_DIR)
+    OUTPUT_DIR_STR: str = str(OUTPUT_DIR)
 
 settings = Settings()
@@ -1,13 +1,43 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.api import routes
 from app.core.config import settings
+from app.services.cleanup import cleanup_periodically
+import asyncio
+import logging
 import os
 
-app = FastAPI(title="Pronunciation Trainer")
+# uvicorn only configures its own loggers. Set LOG_LEVEL=DEBUG for per-request tracing.
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
+log = logging.getLogger(__name__)
 
-# Ensure static directories exist
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the models before serving so the first request doesn't pay for it.
+    # Failures are only logged; the lazy getters will retry on demand.
+    log.info("Warming up models...")
+    results = await asyncio.gather(
+        asyncio.to_thread(routes.get_g2p),
+        asyncio.to_thread(routes.get_recognizer),
+        asyncio.to_thread(routes.get_scorer),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            log.error("Failed to warm up model: %s", result, exc_info=result)
+
+    cleanup_task = asyncio.create_task(cleanup_periodically())
+    yield
+    cleanup_task.cancel()
+
+
+app = FastAPI(title="Pronunciation Trainer", lifespan=lifespan)
+
+# Ensure data directories exist
+os.makedirs(settings.INPUT_DIR, exist_ok=True)
 os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
 
 app.add_middleware(
@@ -21,7 +51,7 @@ app.add_middleware(
 app.include_router(routes.router, prefix="/api")
 
 # Serve generated audio files
-app.mount("/static", StaticFiles(directory=str(settings.OUTPUT_DIR)), name="static")
+app.mount("/static", StaticFiles(directory=settings.OUTPUT_DIR_STR), name="static")
 
 @app.get("/")
 def read_root():
@@ -27,7 +27,7 @@ class AlignerService:
             return self._mock_alignment(text)
 
         # 1. Create a corpus directory for this single file
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
         corpus_dir = settings.DATA_DIR / "temp_align" / session_id
         os.makedirs(corpus_dir, exist_ok=True)
         
@@ -0,0 +1,56 @@
+"""
+Periodic removal of old audio files.
+Generated TTS audio and uploaded recordings would otherwise pile up in the data directories.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+CLEANUP_INTERVAL_SECONDS = 60 * 60  # 1 hour
+MAX_FILE_AGE_SECONDS = 7 * 24 * 60 * 60  # 1 week
+
+
+def _run_cleanup(max_age: float = MAX_FILE_AGE_SECONDS) -> int:
+    """
+    Deletes files older than max_age from the input and output directories.
+    Returns the number of deleted files.
+    """
+    cutoff = time.time() - max_age
+    files_deleted = 0
+    for directory in (settings.INPUT_DIR_STR, settings.OUTPUT_DIR_STR):
+        try:
+            # DirEntry caches its stat result, so each file costs a single syscall
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                        continue
+                    try:
+                        os.remove(entry.path)
+                        files_deleted += 1
+                    except FileNotFoundError:
+                        pass
+        except FileNotFoundError:
+            continue
+    return files_deleted
+
+
+async def cleanup_periodically(interval: float = CLEANUP_INTERVAL_SECONDS):
+    """
+    Runs the cleanup right away and then every `interval` seconds.
+    Starting immediately means files are still collected when the process restarts often.
+    """
+    while True:
+        try:
+            files_deleted = await asyncio.to_thread(_run_cleanup)
+            if files_deleted:
+                log.info("Deleted %d old audio files", files_deleted)
+        except Exception as e:
+            log.exception("Error during cleanup: %s", e)
+        await asyncio.sleep(interval)
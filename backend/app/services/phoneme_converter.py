@@ -3,8 +3,6 @@ ARPAbet → IPA phoneme converter.
 Maps CMU/ARPAbet symbols (used by g2p_en) to International Phonetic Alphabet.
 """
 
-import re
-
 ARPA_TO_IPA = {
     # Vowels
     "AA": "ɑ",
@@ -49,6 +47,12 @@ ARPA_TO_IPA = {
     "ZH": "ʒ",
 }
 
+# Every ARPAbet symbol with and without its stress digit, mapped straight to IPA
+# so the common case is a single dict lookup.
+ARPA_TO_IPA_FULL = {
+    k + s: v for k, v in ARPA_TO_IPA.items() for s in ("", "0", "1", "2")
+}
+
 
 def arpa_to_ipa(phoneme: str) -> str:
     """
@@ -56,11 +60,15 @@ def arpa_to_ipa(phoneme: str) -> str:
     Strips stress markers (0, 1, 2) before lookup.
     Returns the original phoneme if no mapping is found.
     """
+    stripped = phoneme.strip()
+    ipa = ARPA_TO_IPA_FULL.get(stripped)
+    if ipa is not None:
+        return ipa
     # Strip trailing stress digits (e.g. "AH0" -> "AH", "AY1" -> "AY")
-    base = re.sub(r"[012]$", "", phoneme.strip())
-    return ARPA_TO_IPA.get(base, phoneme)
+    return ARPA_TO_IPA.get(stripped.rstrip("012"), phoneme)
 
 
 def convert_phonemes(phonemes: list[str]) -> list[str]:
     """Convert a list of ARPAbet phonemes to IPA."""
-    return [arpa_to_ipa(p) for p in phonemes]
+    lookup = ARPA_TO_IPA_FULL.get
+    return [lookup(p) or arpa_to_ipa(p) for p in phonemes]
@@ -3,37 +3,110 @@ Speech recognition service using OpenAI Whisper.
 Transcribes user audio to text so we can extract actual spoken phonemes.
 """
 
+import functools
+import logging
+import numpy as np
+import soundfile as sf
+import torch
+from concurrent.futures import ThreadPoolExecutor
 import whisper
 
+log = logging.getLogger(__name__)
+
+# Whisper expects 16,000Hz mono audio
+SAMPLE_RATE = 16000
+
+# Allow TF32 tensor cores for any FP32 matmuls on Ampere+ GPUs
+torch.set_float32_matmul_precision("high")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model(model_name: str, device: str) -> whisper.Whisper:
+    """Loads Whisper weights once per (model_name, device) and shares them across services."""
+    log.info("Loading Whisper '%s' model on %s...", model_name, device)
+    model = whisper.load_model(model_name, device=device)
+    log.info("Whisper model loaded.")
+    return model
+
 
 class RecognizerService:
-    def __init__(self, model_name: str = "tiny"):
+    def __init__(self, model_name: str = "tiny", device: str | None = None):
         """
         Initialize Whisper model.
         Model sizes: tiny (~75MB), base (~140MB), small (~460MB)
         'base' is a good balance of speed and accuracy for short phrases.
+        Runs on the GPU when available, where inference uses FP16.
         """
-        print(f"[Recognizer] Loading Whisper '{model_name}' model...")
-        self.model = whisper.load_model(model_name)
-        print(f"[Recognizer] Whisper model loaded.")
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.model = _load_model(model_name, self.device)
+
+    def _load_audio(self, audio_path: str) -> torch.Tensor:
+        """
+        Loads audio using soundfile to avoid ffmpeg dependency, resampling only
+        when the file is not already 16kHz. Falls back to librosa for formats
+        libsndfile cannot decode.
+        Returns 16kHz mono samples as a tensor on the model's device.
+        """
+        log.debug("Loading audio: %s", audio_path)
+        try:
+            audio, sr = sf.read(audio_path, dtype="float32", always_2d=False)
+        except RuntimeError:
+            import librosa
+            log.debug("soundfile could not read %s, falling back to librosa", audio_path)
+            audio, sr = librosa.load(audio_path, sr=SAMPLE_RATE)
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        if sr != SAMPLE_RATE:
+            from scipy.signal import resample_poly
+            audio = resample_poly(audio, SAMPLE_RATE, sr).astype(np.float32, copy=False)
+        # Hand Whisper a tensor already on the model's device so the log-mel STFT
+        # runs there too (zero-copy on CPU)
+        return torch.from_numpy(audio).to(self.device)
 
     def transcribe(self, audio_path: str) -> str:
         """
         Transcribe an audio file to text.
-        Loads audio using librosa to avoid ffmpeg dependency.
         Returns the recognized text (lowercased, stripped).
         """
-        import librosa
-        print(f"[Recognizer] Loading audio with librosa: {audio_path}")
-        # Whisper expects 16,000Hz mono audio
-        audio, _ = librosa.load(audio_path, sr=16000)
+        audio = self._load_audio(audio_path)
         
-        print(f"[Recognizer] Transcribing with Whisper...")
-        result = self.model.transcribe(
-            audio,
-            language="en",
-            fp16=False,
-        )
+        log.debug("Transcribing with Whisper...")
+        # inference_mode also skips the view/version tracking no_grad keeps
+        with torch.inference_mode():
+            result = self.model.transcribe(
+                audio,
+                language="en",
+                # FP16 is only supported on the GPU
+                fp16=self.device == "cuda",
+            )
         text = result["text"].strip()
-        print(f"[Recognizer] Transcription: '{text}'")
+        log.debug("Transcription: '%s'", text)
         return text
+
+    def transcribe_batch(self, audio_paths: list[str]) -> list[str]:
+        """
+        Transcribe several short clips (up to 30 seconds each) in one batched forward pass.
+        Files are loaded in parallel threads. Unlike transcribe(), this decodes a single
+        30-second window per clip without temperature fallback.
+        Returns the recognized texts in the order of audio_paths.
+        """
+        if not audio_paths:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(audio_paths))) as executor:
+            audios = list(executor.map(self._load_audio, audio_paths))
+
+        # Whisper pads every clip to a 30-second window, so the mels stack without masks
+        mels = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), self.model.dims.n_mels)
+            for audio in audios
+        ])
+        log.debug("Transcribing batch of %d clips with Whisper...", len(audio_paths))
+        options = whisper.DecodingOptions(
+            language="en",
+            without_timestamps=True,
+            fp16=self.device == "cuda",
+        )
+        with torch.inference_mode():
+            results = whisper.decode(self.model, mels, options)
+        return [result.text.strip() for result in results]
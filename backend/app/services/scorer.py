@@ -1,36 +1,57 @@
-import Levenshtein
+from rapidfuzz.distance import Indel
+
+
+def _lcs_opcodes(ref_str: str, user_str: str) -> list[tuple[str, int, int, int, int]]:
+    """
+    Aligns two strings on their longest common subsequence (insert/delete only).
+    Adjacent delete and insert runs are merged into a single 'replace' block so
+    they can be shown as substitutions, like difflib's get_opcodes().
+    """
+    opcodes = []
+    run = []  # non-equal ops since the last 'equal' block
+
+    def flush_run():
+        if not run:
+            return
+        tags = {op.tag for op in run}
+        tag = 'replace' if len(tags) > 1 else run[0].tag
+        opcodes.append((tag, run[0].src_start, run[-1].src_end, run[0].dest_start, run[-1].dest_end))
+        run.clear()
+
+    for op in Indel.opcodes(ref_str, user_str):
+        if op.tag == 'equal':
+            flush_run()
+            opcodes.append(('equal', op.src_start, op.src_end, op.dest_start, op.dest_end))
+        else:
+            run.append(op)
+    flush_run()
+    return opcodes
+
 
 class ScorerService:
     def compare_phonemes(self, ref_phonemes: list[str], user_phonemes: list[str]) -> dict:
         """
-        Compares reference phonemes with user phonemes using Levenshtein distance.
+        Compares reference phonemes with user phonemes on their longest common subsequence.
         Returns a dictionary with the score and detailed alignment ops.
         """
-        # Convert lists to strings for Levenshtein (using a separator to avoid ambiguity if needed, 
-        # but Levenshtein works on sequences. simple Levenshtein.ratio works on strings)
-        # However, for phonemes we want sequence alignment.
-        # python-Levenshtein 'ratio' works on strings. 'editops' works on sequences.
-        
-        # Map phonemes to single characters for easier Levenshtein if convenient, 
-        # or use editops directly on the lists? 
-        # 'Levenshtein.editops' supports lists in newer versions, checking...
-        # If not, we map to char. identifying unique phonemes...
-        
-        # Fallback: simple string comparison if lists fail, but let's try sequence alignment first.
-        # Actually, Levenshtein.ratio(str1, str2).
-        
-        # Let's try to map phonemes to private use unicode characters for accurate diffing
-        # Or just use sequence matcher from difflib which is standard python
-        
-        import difflib
-        matcher = difflib.SequenceMatcher(None, ref_phonemes, user_phonemes)
-        ratio = matcher.ratio()
+        # rapidfuzz works on strings, so map each distinct phoneme to a single
+        # private use unicode character and diff the resulting strings in C.
+        alphabet = {p: chr(0xE000 + i) for i, p in enumerate(set(ref_phonemes) | set(user_phonemes))}
+        ref_str = "".join([alphabet[p] for p in ref_phonemes])
+        user_str = "".join([alphabet[p] for p in user_phonemes])
+        opcodes = _lcs_opcodes(ref_str, user_str)
+
+        # Score and details come from the same alignment, so the highlighted
+        # matches always add up to the score: 2 * matches / total length
+        total = len(ref_phonemes) + len(user_phonemes)
+        matches = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag == 'equal')
+        ratio = 2.0 * matches / total if total else 1.0
         
         score = int(ratio * 100)
         
         # Generate diff details
         details = []
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        for tag, i1, i2, j1, j2 in opcodes:
             if tag == 'equal':
                 for k in range(i2 - i1):
                     details.append({"phoneme": ref_phonemes[i1+k], "status": "match", "user": user_phonemes[j1+k]})
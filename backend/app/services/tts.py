@@ -1,8 +1,12 @@
 import edge_tts
+import hashlib
+import logging
 import os
 import uuid
 from app.core.config import settings
 
+log = logging.getLogger(__name__)
+
 
 class TTSService:
     DEFAULT_VOICE = "en-US-AriaNeural"
@@ -15,20 +19,34 @@ class TTSService:
     async def generate_audio(self, text: str) -> str:
         """
         Generates audio from text using edge-tts and saves it to a file.
+        Files are named after a hash of voice, rate and text, so repeated
+        requests reuse the existing file instead of calling edge-tts again.
         Returns the absolute path to the audio file.
         """
-        print(f"[TTS] Generating audio for: '{text}' with voice '{self.voice}', rate '{self.rate}'")
-        filename = f"{uuid.uuid4()}.mp3"
-        output_path = settings.OUTPUT_DIR / filename
+        key = hashlib.sha256(f"{self.voice}|{self.rate}|{text}".encode()).hexdigest()
+        output_path = os.path.join(settings.OUTPUT_DIR_STR, f"tts_{key}.mp3")
+        try:
+            # Refresh the mtime so the periodic cleanup keeps phrases that are still in use
+            os.utime(output_path)
+            log.debug("Using cached audio for '%s': %s", text, output_path)
+            return output_path
+        except FileNotFoundError:
+            pass
 
-        # Ensure directory exists
-        os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
+        log.debug("Generating audio for: '%s' with voice '%s', rate '%s'", text, self.voice, self.rate)
+        # Write to a temporary file first so concurrent requests never serve a partial file
+        tmp_path = f"{output_path}.{uuid.uuid4().hex}.tmp"
 
         try:
             communicate = edge_tts.Communicate(text, self.voice, rate=self.rate)
-            await communicate.save(str(output_path))
-            print(f"[TTS] Generation complete: {output_path}")
-            return str(output_path)
+            await communicate.save(tmp_path)
+            os.replace(tmp_path, output_path)
+            log.debug("Generation complete: %s", output_path)
+            return output_path
         except Exception as e:
-            print(f"[TTS] Error generating audio: {e}")
+            log.error("Error generating audio: %s", e)
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
             raise e
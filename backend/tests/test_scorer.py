@@ -0,0 +1,18 @@
+from app.services.scorer import ScorerService
+
+
+def test_details_matches_add_up_to_score():
+    # Regression: the score counted 3 matches while the details showed only 2
+    result = ScorerService().compare_phonemes(["a", "a", "a", "b"], ["a", "a", "b", "c"])
+
+    assert result["score"] == 75
+    matched = [d for d in result["details"] if d["status"] == "match"]
+    assert [d["phoneme"] for d in matched] == ["a", "a", "b"]
+    assert all(d["user"] == d["phoneme"] for d in matched)
+
+
+def test_adjacent_delete_and_insert_are_shown_as_substitution():
+    result = ScorerService().compare_phonemes(["h", "ʌ", "l", "oʊ"], ["h", "ɛ", "l", "oʊ"])
+
+    assert result["score"] == 75
+    assert result["details"][1] == {"phoneme": "ʌ", "status": "substitution", "user": "ɛ"}